@@ -1,4 +1,3 @@
-import os
 from pathlib import Path
 from models import Experiment
 from typing import List
@@ -33,4 +32,8 @@ EXPERIMENTS: List[Experiment] = [
     ),
 ]
 
-EXPERIMENTS_PATH = Path(os.path.abspath("../experiments"))
+# Paths are resolved from this file, not the working directory the server was started from
+SERVER_PATH = Path(__file__).resolve().parent
+EXPERIMENTS_PATH = SERVER_PATH.parent / "experiments"
+STATIC_PATH = SERVER_PATH / "static"
+ARTIFACTS_CACHE_PATH = SERVER_PATH / "cache" / "artifacts"
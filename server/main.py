@@ -1,19 +1,30 @@
 import os
-import shutil
-import subprocess
-import shlex
+import re
+import stat
+import io
+import itertools
+import tempfile
+import zipfile
+from contextlib import asynccontextmanager
+from functools import lru_cache
 from pathlib import Path
-from typing import List, Optional, Tuple, Iterator
+from typing import AsyncIterator, Dict, Optional, Tuple, Iterator
 import asyncio
 import logging
 
+import anyio.to_thread
+import docker
+import orjson
+import requests
 import uvicorn
-from fastapi import FastAPI, HTTPException, WebSocket, WebSocketDisconnect
+from fastapi import FastAPI, HTTPException, Request, WebSocket
+from fastapi.concurrency import run_in_threadpool
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import RedirectResponse, FileResponse, StreamingResponse
+from fastapi.responses import FileResponse, ORJSONResponse, Response, StreamingResponse
 from fastapi.staticfiles import StaticFiles
+from starlette.websockets import WebSocketClose
 
-from config import EXPERIMENTS, EXPERIMENTS_PATH
+from config import ARTIFACTS_CACHE_PATH, EXPERIMENTS, EXPERIMENTS_PATH, STATIC_PATH
 from models import Experiment, NameRequest
 
 
@@ -22,87 +33,139 @@ logger = logging.getLogger("uvicorn")
 
 
 # FastAPI
-app = FastAPI(title="Docker Experiment Manager")
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    _validate_configs()
+    yield
+
+app = FastAPI(title="Docker Experiment Manager", lifespan=lifespan, default_response_class=ORJSONResponse)
 app.add_middleware(
     CORSMiddleware,
     allow_origins=["*"],
     allow_credentials=True,
     allow_methods=["GET", "POST", "OPTIONS"],
     allow_headers=["Content-Type"],
+    max_age=86400,  # Let browsers cache preflight responses for a day
 )
-app.mount("/static", StaticFiles(directory="static"), name="static")
 
 # Helpers
-def _get_config(name: str) -> Experiment:
-    """
-    Retrieves the experiment configuration by name.
-    Args:
-        name: The experiment name.
-    Returns:
-        Experiment: Matching experiment configuration.
-    Raises:
-        HTTPException: If the experiment name does not exist.
-    """
-    for cfg in EXPERIMENTS:
-        if cfg.name == name:
-            return cfg
-    raise HTTPException(status_code=404, detail=f"Experiment '{name}' not found")
-
-def _get_exp_paths(name: str) -> Tuple[Experiment, Path, Optional[Path]]:
+def _resolve_exp_paths(cfg: Experiment) -> Tuple[Experiment, Path, Optional[Path]]:
     """
     Resolves experiment paths based on configuration.
     Args:
-        name: The experiment name.
+        cfg: The experiment configuration.
     Returns:
         Tuple of:
             - Experiment configuration
             - Experiment directory path
             - Artifacts directory path (if defined)
     """
-    cfg = _get_config(name)
     exp_dir = EXPERIMENTS_PATH / cfg.name
     art_dir = exp_dir / cfg.artifacts_path.strip() if cfg.artifacts_path.strip() else None
     return cfg, exp_dir, art_dir
 
-def _run_cli(cmd: List[str], cwd: Optional[Path] = None, timeout: Optional[int] = None) -> str:
+def _probe_dockerfile(exp_dir: Path) -> Optional[Path]:
     """
-    Runs a shell command and return its output.
+    Looks up the Dockerfile for the host architecture with a single directory scan.
     Args:
-        cmd: Command and arguments as a list.
-        cwd: Working directory for the command.
-        timeout: Optional timeout in seconds.
+        exp_dir: Experiment directory.
     Returns:
-        Captured stdout as a string.
+        Path to Dockerfile, or None if it or the experiment directory is missing.
+    """
+    try:
+        with os.scandir(exp_dir) as it:
+            for entry in it:
+                if entry.name == _DOCKERFILE_NAME and entry.is_file():
+                    return exp_dir / entry.name
+    except OSError:
+        pass
+    return None
+
+# Configs, paths and host architecture are static, so resolve them once
+_DOCKERFILE_NAME = "Dockerfile.arm64" if os.uname().machine == "aarch64" else "Dockerfile"
+_EXPERIMENTS_BY_NAME: Dict[str, Experiment] = {cfg.name: cfg for cfg in EXPERIMENTS}
+_PATHS_BY_NAME: Dict[str, Tuple[Experiment, Path, Optional[Path]]] = {
+    cfg.name: _resolve_exp_paths(cfg) for cfg in EXPERIMENTS
+}
+_DOCKERFILE_PATHS: Dict[str, Optional[Path]] = {
+    name: _probe_dockerfile(exp_dir) for name, (_, exp_dir, _) in _PATHS_BY_NAME.items()
+}
+_EXPERIMENTS_JSON = orjson.dumps({"experiments": [cfg.model_dump() for cfg in EXPERIMENTS]})
+
+# Build and log streams block a thread in a socket read for their whole duration,
+# so they run under their own limiter instead of taking anyio's 40 default tokens
+_STREAM_READERS = 128
+_STREAM_LIMITER = anyio.CapacityLimiter(_STREAM_READERS)
+# Every threadpool worker and stream reader may hold a daemon connection,
+# so size the shared client's pool to both rather than docker's default of 10
+_DOCKER_POOL_SIZE = 40 + _STREAM_READERS
+
+# Artifact archives are cached on disk as <name>-<latest mtime>.zip
+_ZIP_CHUNK_SIZE = 1 << 20
+_ARTIFACTS_CACHE_CONTROL = "public, max-age=60"
+_STORED_SUFFIXES = frozenset({
+    ".zip", ".gz", ".bz2", ".xz", ".png", ".jpg", ".jpeg", ".parquet", ".bin", ".pt", ".safetensors",
+})
+
+# Log streaming: chunks are coalesced into one websocket frame per batch
+_LOG_QUEUE_SIZE = 1024
+_LOG_BATCH_BYTES = 64 * 1024
+_LOG_FLUSH_INTERVAL = 0.02
+
+def _validate_configs():
+    """
+    Validates the experiment configs at startup, failing fast on broken ones.
+    A missing Dockerfile only disables /build for that experiment.
+    Raises:
+        RuntimeError: If experiment names are duplicated or a directory is missing.
+    """
+    if len(_EXPERIMENTS_BY_NAME) != len(EXPERIMENTS):
+        raise RuntimeError("Duplicate experiment names in EXPERIMENTS")
+    for name, (_, exp_dir, _) in _PATHS_BY_NAME.items():
+        if not exp_dir.is_dir():
+            raise RuntimeError(f"Experiment directory not found: {exp_dir}")
+        if _DOCKERFILE_PATHS[name] is None:
+            logger.warning("%s not found for experiment '%s'", _DOCKERFILE_NAME, name)
+
+def _get_config(name: str) -> Experiment:
+    """
+    Retrieves the experiment configuration by name.
+    Args:
+        name: The experiment name.
+    Returns:
+        Experiment: Matching experiment configuration.
     Raises:
-        HTTPException: On failure or timeout.
+        HTTPException: If the experiment name does not exist.
     """
     try:
-        logger.info(f"Running command: {' '.join(cmd)}")
-        res = subprocess.run(
-            cmd,
-            cwd=str(cwd) if cwd else None,
-            stdout=subprocess.PIPE,
-            stderr=subprocess.STDOUT,
-            check=True,
-            text=True,
-            timeout=timeout,
-        )
-        return res.stdout
-    except subprocess.CalledProcessError as e:
-        logger.info("Docker error: %s", e.stdout.strip().splitlines()[0] if e.stdout else "")
-        raise HTTPException(status_code=404, detail=e.stdout)
-    except subprocess.TimeoutExpired:
-        raise HTTPException(status_code=504, detail="Command timed out")
+        return _EXPERIMENTS_BY_NAME[name]
+    except KeyError:
+        raise HTTPException(status_code=404, detail=f"Experiment '{name}' not found")
 
-def _container_name(name: str) -> str:
+def _get_exp_paths(name: str) -> Tuple[Experiment, Path, Optional[Path]]:
     """
-    Derives a standardized Docker container name.
+    Retrieves the precomputed experiment paths by name.
     Args:
-        name: Experiment name.
+        name: The experiment name.
+    Returns:
+        Tuple of configuration, experiment directory and artifacts directory.
+    Raises:
+        HTTPException: If the experiment name does not exist.
+    """
+    try:
+        return _PATHS_BY_NAME[name]
+    except KeyError:
+        raise HTTPException(status_code=404, detail=f"Experiment '{name}' not found")
+
+@lru_cache(maxsize=None)
+def _docker_client() -> docker.DockerClient:
+    """
+    Returns the shared Docker Engine API client.
+    Created lazily so the app can start (and serve the UI) without a daemon.
     Returns:
-        Container name string.
+        docker.DockerClient connected via the environment settings.
     """
-    return name.replace("_", "-") + "-container"
+    return docker.from_env(max_pool_size=_DOCKER_POOL_SIZE)
 
 def _remove_container(cname: str):
     """
@@ -111,79 +174,360 @@ def _remove_container(cname: str):
         cname: Container name.
     """
     try:
-        _run_cli(["docker", "rm", "-f", cname])
-    except HTTPException:
+        _docker_client().api.remove_container(cname, force=True)
+    except docker.errors.NotFound:
         pass
 
-def _stream_process(cmd: List[str], cwd: Optional[Path] = None) -> Iterator[str]:
+def _start_container(cfg: Experiment, exp_dir: Path) -> str:
     """
-    Runs a process and streams its stdout line by line.
+    Replaces any previous container of the experiment with a fresh one.
     Args:
-        cmd: Command and arguments as a list.
-        cwd: Working directory for the process.
+        cfg: Experiment configuration.
+        exp_dir: Experiment directory, mounted at /app.
+    Returns:
+        ID of the started container.
+    """
+    _remove_container(cfg.container_name)
+    api = _docker_client().api
+    container = api.create_container(
+        image=cfg.tag,
+        command=cfg.entrypoint_argv or None,
+        name=cfg.container_name,
+        working_dir="/app",
+        volumes=["/app"],
+        host_config=api.create_host_config(binds={str(exp_dir): {"bind": "/app", "mode": "rw"}}),
+    )
+    api.start(container["Id"])
+    return container["Id"]
+
+async def _iterate_stream(stream: Iterator[bytes]) -> AsyncIterator[bytes]:
+    """
+    Iterates a blocking Docker stream from a thread under _STREAM_LIMITER.
+    Args:
+        stream: Blocking iterator, e.g. a build or log stream.
     Yields:
-        Output lines as strings.
-    """
-    proc = subprocess.Popen(
-        cmd,
-        cwd=str(cwd) if cwd else None,
-        stdout=subprocess.PIPE,
-        stderr=subprocess.STDOUT,
-        text=True,
+        Chunks of the stream.
+    """
+    done = object()
+    while True:
+        chunk = await anyio.to_thread.run_sync(next, stream, done, limiter=_STREAM_LIMITER)
+        if chunk is done:
+            return
+        yield chunk
+
+def _start_build(exp_dir: Path, dockerfile: Path, tag: str) -> Iterator[bytes]:
+    """
+    Sends the build request to the Engine API.
+    The request is sent eagerly, so connection and API errors are raised here
+    rather than after the response headers have gone out.
+    Args:
+        exp_dir: Build context directory.
+        dockerfile: Dockerfile inside the build context.
+        tag: Image tag.
+    Returns:
+        Iterator of raw Engine build output: newline-delimited JSON messages.
+    """
+    chunks = _docker_client().api.build(
+        path=str(exp_dir),
+        dockerfile=dockerfile.name,
+        tag=tag,
+        rm=True,
     )
-    for line in proc.stdout:
-        yield line
-    proc.wait()
+    # A rejected build comes back unchunked and only raises on the first read
+    first = next(chunks, b"")
+    return itertools.chain((first,), chunks)
 
-def _select_dockerfile(exp_dir: Path) -> Path:
+async def _stream_build(chunks: Iterator[bytes]) -> AsyncIterator[bytes]:
+    """
+    Streams build output, reporting errors raised mid-build as a final NDJSON message.
+    Args:
+        chunks: Iterator returned by _start_build.
+    Yields:
+        Raw Engine build output.
+    """
+    try:
+        async for chunk in _iterate_stream(chunks):
+            yield chunk
+    except (docker.errors.DockerException, requests.exceptions.RequestException) as e:
+        detail = getattr(e, "explanation", None) or str(e)
+        logger.info("Docker build error: %s", detail)
+        yield orjson.dumps({"error": detail}) + b"\n"
+
+def _select_dockerfile(name: str) -> Path:
     """
     Selects Dockerfile based on architecture.
     Args:
-        exp_dir: Experiment directory.
+        name: The experiment name.
     Returns:
         Path to Dockerfile.
     Raises:
         HTTPException: If the file is missing.
     """
-    dockerfile_name = "Dockerfile.arm64" if os.uname().machine == "aarch64" else "Dockerfile"
-    path = exp_dir / dockerfile_name
-    if not path.exists():
-        raise HTTPException(status_code=404, detail=f"{dockerfile_name} not found")
+    path = _DOCKERFILE_PATHS.get(name)
+    if path is None:
+        raise HTTPException(status_code=404, detail=f"{_DOCKERFILE_NAME} not found")
     return path
 
-# Routes
-@app.get("/", include_in_schema=False)
-def root():
-    return RedirectResponse(url="/static/index.html")
+def _walk_artifacts(root: Path) -> Iterator[Tuple[str, os.DirEntry]]:
+    """
+    Walks the artifacts tree once with os.scandir.
+    Args:
+        root: Artifacts directory.
+    Yields:
+        Tuples of path relative to root and its directory entry, directories included.
+    """
+    pending = [(root, "")]
+    while pending:
+        directory, prefix = pending.pop()
+        with os.scandir(directory) as it:
+            for entry in it:
+                yield prefix + entry.name, entry
+                if entry.is_dir(follow_symlinks=False):
+                    pending.append((Path(entry.path), prefix + entry.name + "/"))
 
-# @app.get("/logs", include_in_schema=False)
-# def logs_page():
-#     return FileResponse("static/logs.html")
+def _latest_mtime(root: Path) -> int:
+    """
+    Finds the latest mtime of the artifacts, used as the ETag and cache key.
+    Args:
+        root: Artifacts directory.
+    Returns:
+        Latest mtime in nanoseconds, including the directory itself.
+    """
+    latest = root.stat().st_mtime_ns
+    for _, entry in _walk_artifacts(root):
+        latest = max(latest, entry.stat().st_mtime_ns)
+    return latest
+
+def _etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """
+    Checks If-None-Match against an ETag using weak comparison.
+    Args:
+        if_none_match: Header value, if sent.
+        etag: Current ETag of the resource.
+    Returns:
+        True if the header is "*" or lists the ETag, weak (W/) or not.
+    """
+    if not if_none_match:
+        return False
+    for tag in if_none_match.split(","):
+        tag = tag.strip()
+        if tag == "*" or tag.removeprefix("W/") == etag:
+            return True
+    return False
+
+class _ZipSink(io.RawIOBase):
+    """
+    Unseekable zip output that tees into a cache file and a drainable buffer.
+    """
+    def __init__(self, fp):
+        self._fp = fp
+        self._buf = bytearray()
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, b) -> int:
+        self._fp.write(b)
+        self._buf += b
+        return len(b)
+
+    def drain(self) -> Iterator[bytes]:
+        if self._buf:
+            data = bytes(self._buf)
+            self._buf.clear()
+            yield data
+
+def _cached_archive(name: str, mtime: int) -> Optional[Path]:
+    """
+    Looks up a cached artifacts archive, possibly written by another worker.
+    Args:
+        name: The experiment name.
+        mtime: Latest mtime of the artifacts.
+    Returns:
+        Path to the zip archive, or None if it is missing or stale.
+    """
+    zip_path = ARTIFACTS_CACHE_PATH / f"{name}-{mtime}.zip"
+    return zip_path if zip_path.exists() else None
+
+def _remove_stale_archives(name: str, mtime: int):
+    """
+    Deletes every other cached archive of the experiment, whichever worker
+    or earlier run wrote it.
+    Args:
+        name: The experiment name.
+        mtime: Latest mtime of the archive just written, which is kept.
+    """
+    pattern = re.compile(re.escape(name) + r"-(\d+)\.zip")
+    with os.scandir(ARTIFACTS_CACHE_PATH) as it:
+        for entry in it:
+            match = pattern.fullmatch(entry.name)
+            if match and int(match.group(1)) != mtime:
+                Path(entry.path).unlink(missing_ok=True)
+
+def _stream_artifacts(name: str, art_dir: Path, mtime: int) -> Iterator[bytes]:
+    """
+    Streams a zip archive of the artifacts and caches it once complete.
+    Already compressed files are stored, the rest deflated at level 1.
+    Args:
+        name: The experiment name.
+        art_dir: Artifacts directory.
+        mtime: Latest mtime of the artifacts, used as the cache key.
+    Yields:
+        Zip archive bytes, flushed after every file chunk.
+    """
+    # Only a cache miss needs the listing; a 304 or cached archive skips it
+    arcnames = sorted(arcname for arcname, _ in _walk_artifacts(art_dir))
+    ARTIFACTS_CACHE_PATH.mkdir(parents=True, exist_ok=True)
+    zip_path = ARTIFACTS_CACHE_PATH / f"{name}-{mtime}.zip"
+    fd, tmp_path = tempfile.mkstemp(dir=ARTIFACTS_CACHE_PATH, suffix=".tmp")
+    try:
+        with open(fd, "wb") as fp:
+            sink = _ZipSink(fp)
+            with zipfile.ZipFile(sink, "w") as zf:
+                for arcname in arcnames:
+                    path = art_dir / arcname
+                    info = zipfile.ZipInfo.from_file(path, arcname)
+                    if info.is_dir():
+                        zf.writestr(info, b"")
+                        continue
+                    if path.suffix.lower() in _STORED_SUFFIXES:
+                        info.compress_type = zipfile.ZIP_STORED
+                    else:
+                        info.compress_type = zipfile.ZIP_DEFLATED
+                        # ZipFile.open(info, "w") ignores the archive-level compresslevel;
+                        # the attribute is public as compress_level from Python 3.13
+                        if hasattr(info, "compress_level"):
+                            info.compress_level = 1
+                        else:
+                            info._compresslevel = 1
+                    with open(path, "rb") as src, zf.open(info, "w") as dst:
+                        for chunk in iter(lambda: src.read(_ZIP_CHUNK_SIZE), b""):
+                            dst.write(chunk)
+                            yield from sink.drain()
+            yield from sink.drain()
+        os.replace(tmp_path, zip_path)
+    except BaseException:
+        Path(tmp_path).unlink(missing_ok=True)
+        raise
+    _remove_stale_archives(name, mtime)
+
+async def _pump_logs(stream: Iterator[bytes], queue: asyncio.Queue):
+    """
+    Reads a blocking log stream into a bounded queue.
+    Args:
+        stream: Docker log stream.
+        queue: Queue to feed; None is put once the stream ends.
+    """
+    try:
+        async for chunk in _iterate_stream(stream):
+            await queue.put(chunk)
+    except Exception as e:
+        logger.info("Log stream error: %s", e)
+    await queue.put(None)
+
+async def _next_log_batch(queue: asyncio.Queue) -> Tuple[bytes, bool]:
+    """
+    Waits for log output, then collects more until the flush interval passes
+    or _LOG_BATCH_BYTES are buffered, whichever comes first.
+    Args:
+        queue: Queue fed by _pump_logs.
+    Returns:
+        Tuple of batched log bytes and whether the stream is over.
+    """
+    chunk = await queue.get()
+    if chunk is None:
+        return b"", True
+    buf = bytearray(chunk)
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + _LOG_FLUSH_INTERVAL
+    while len(buf) < _LOG_BATCH_BYTES:
+        if queue.empty():
+            remaining = deadline - loop.time()
+            if remaining <= 0:
+                break
+            try:
+                chunk = await asyncio.wait_for(queue.get(), remaining)
+            except asyncio.TimeoutError:
+                break
+        else:
+            chunk = queue.get_nowait()
+        if chunk is None:
+            return bytes(buf), True
+        buf += chunk
+    return bytes(buf), False
+
+async def _send_logs(ws: WebSocket, queue: asyncio.Queue):
+    """
+    Sends batched log output from the queue until the stream ends.
+    Args:
+        ws: WebSocket connection.
+        queue: Queue fed by _pump_logs.
+    """
+    done = False
+    while not done:
+        data, done = await _next_log_batch(queue)
+        if data:
+            await ws.send_bytes(data)
+
+async def _wait_disconnect(ws: WebSocket):
+    """
+    Waits until the client closes the WebSocket, ignoring any messages it sends.
+    Args:
+        ws: WebSocket connection.
+    """
+    while (await ws.receive())["type"] != "websocket.disconnect":
+        pass
+
+# Error handlers
+@app.exception_handler(docker.errors.NotFound)
+async def docker_not_found(request: Request, exc: docker.errors.NotFound):
+    logger.info("Docker error: %s", exc.explanation)
+    return ORJSONResponse(status_code=404, content={"detail": exc.explanation})
+
+@app.exception_handler(docker.errors.DockerException)
+async def docker_error(request: Request, exc: docker.errors.DockerException):
+    detail = getattr(exc, "explanation", None) or str(exc)
+    logger.info("Docker error: %s", detail)
+    return ORJSONResponse(status_code=500, content={"detail": detail})
+
+@app.exception_handler(requests.exceptions.RequestException)
+async def docker_request_error(request: Request, exc: requests.exceptions.RequestException):
+    logger.info("Docker request error: %s", exc)
+    return ORJSONResponse(status_code=500, content={"detail": str(exc)})
+
+@app.exception_handler(requests.exceptions.Timeout)
+async def docker_timeout(request: Request, exc: requests.exceptions.Timeout):
+    logger.info("Docker timeout: %s", exc)
+    return ORJSONResponse(status_code=504, content={"detail": "Docker daemon timed out"})
+
+# Routes
+@app.get("/logs", include_in_schema=False)
+async def logs_page():
+    return FileResponse(STATIC_PATH / "logs.html")
 
 @app.get("/experiments", summary="List all experiments with full configs")
-def list_experiments():
-    return {"experiments": [cfg.dict() for cfg in EXPERIMENTS]}
+async def list_experiments():
+    return Response(content=_EXPERIMENTS_JSON, media_type="application/json")
 
 @app.post("/build", summary="Build Docker image (streaming logs)")
-def build_image(req: NameRequest):
+async def build_image(req: NameRequest):
     """
     Builds a Docker image for the experiment.
+    The build request is sent before the response starts, so daemon errors map to
+    HTTP errors; errors raised mid-build are streamed as an NDJSON error message.
     Args:
         req: Request containing experiment name.
     Returns:
-        StreamingResponse of Docker build logs.
+        StreamingResponse of Docker build logs as NDJSON.
     """
     cfg, exp_dir, _ = _get_exp_paths(req.experiment_name)
-    dockerfile = _select_dockerfile(exp_dir)
-    tag = cfg.name.lower().replace("_", "-")
-    logger.info(f"Building image with tag {tag} from {dockerfile}")
-    return StreamingResponse(
-        _stream_process(["docker", "build", "-t", tag, "-f", str(dockerfile), "."], cwd=exp_dir),
-        media_type="text/plain",
-    )
+    dockerfile = _select_dockerfile(cfg.name)
+    logger.info(f"Building image with tag {cfg.tag} from {dockerfile}")
+    chunks = await run_in_threadpool(_start_build, exp_dir, dockerfile, cfg.tag)
+    return StreamingResponse(_stream_build(chunks), media_type="application/x-ndjson")
 
 @app.post("/run", summary="Run container for experiment")
-def run_container(req: NameRequest):
+async def run_container(req: NameRequest):
     """
     Runs a Docker container for the specified experiment.
     Args:
@@ -192,70 +536,114 @@ def run_container(req: NameRequest):
         JSON with container ID.
     """
     cfg, exp_dir, _ = _get_exp_paths(req.experiment_name)
-    cname = _container_name(cfg.name)
-    _remove_container(cname)
-    tag = cfg.name.lower().replace("_", "-")
-    cmd = ["docker", "run", "--name", cname, "--detach", "--volume", f"{exp_dir}:/app", "--workdir", "/app", tag]
-    if cfg.entrypoint.strip():
-        cmd += shlex.split(cfg.entrypoint)
-    cid = _run_cli(cmd, cwd=exp_dir).strip()
+    cid = await run_in_threadpool(_start_container, cfg, exp_dir)
     return {"container_id": cid}
 
 @app.post("/remove", summary="Remove container for experiment")
-def remove_container(req: NameRequest):
-    cname = _container_name(req.experiment_name)
-    _remove_container(cname)
-    return {"removed": cname}
+async def remove_container(req: NameRequest):
+    cfg = _get_config(req.experiment_name)
+    await run_in_threadpool(_remove_container, cfg.container_name)
+    return {"removed": cfg.container_name}
 
 @app.get("/artifacts/{experiment_name}", summary="Download experiment artifacts")
-def download_artifacts(experiment_name: str):
+async def download_artifacts(experiment_name: str, request: Request):
     """
     Downloads experiment artifacts as a zip archive.
+    The ETag tracks the artifacts' latest mtime, so unchanged artifacts revalidate with a 304.
     Args:
         experiment_name: The experiment name.
+        request: Incoming request, checked for If-None-Match.
     Returns:
-        FileResponse with zip file of artifacts.
+        FileResponse of the cached zip archive, or a StreamingResponse that builds it.
     Raises:
         HTTPException: If artifacts are not found.
     """
     cfg, _, art_dir = _get_exp_paths(experiment_name)
-    if not art_dir or not art_dir.exists() or not art_dir.is_dir():
+    try:
+        is_dir = art_dir is not None and stat.S_ISDIR(os.stat(art_dir).st_mode)
+    except OSError:
+        is_dir = False
+    if not is_dir:
         raise HTTPException(status_code=404, detail=f"Artifacts not found for '{experiment_name}'")
-    zip_path = shutil.make_archive(str(art_dir), 'zip', root_dir=str(art_dir))
-    return FileResponse(path=zip_path, filename=f"{cfg.name}-artifacts.zip", media_type="application/zip")
+    mtime = await run_in_threadpool(_latest_mtime, art_dir)
+    etag = f'"{cfg.name}-{mtime}"'
+    headers = {"ETag": etag, "Cache-Control": _ARTIFACTS_CACHE_CONTROL}
+    if _etag_matches(request.headers.get("if-none-match"), etag):
+        return Response(status_code=304, headers=headers)
+
+    filename = f"{cfg.name}-artifacts.zip"
+    zip_path = _cached_archive(cfg.name, mtime)
+    if zip_path:
+        return FileResponse(path=zip_path, filename=filename, media_type="application/zip", headers=headers)
+    headers["Content-Disposition"] = f'attachment; filename="{filename}"'
+    return StreamingResponse(
+        _stream_artifacts(cfg.name, art_dir, mtime),
+        media_type="application/zip",
+        headers=headers,
+    )
 
 @app.websocket("/ws/logs/container/{container_id}")
 async def websocket_logs(ws: WebSocket, container_id: str):
     """
     Streams Docker container logs over WebSocket.
+    Log output is sent as binary frames of raw bytes; errors as text frames.
     Args:
         ws: WebSocket connection.
         container_id: Target container ID.
     """
     await ws.accept()
-    proc = await asyncio.create_subprocess_exec(
-        "docker", "logs", "-f", container_id,
-        stdout=asyncio.subprocess.PIPE,
-        stderr=asyncio.subprocess.STDOUT,
-    )
+    try:
+        stream = await run_in_threadpool(
+            lambda: _docker_client().api.logs(container_id, stream=True, follow=True)
+        )
+    except docker.errors.DockerException as e:
+        await ws.send_text(getattr(e, "explanation", None) or str(e))
+        await ws.close()
+        return
 
+    # Stop as soon as either the log stream ends or the client goes away,
+    # instead of noticing the disconnect only on the next send
+    queue: asyncio.Queue = asyncio.Queue(maxsize=_LOG_QUEUE_SIZE)
+    producer = asyncio.create_task(_pump_logs(stream, queue))
+    sender = asyncio.create_task(_send_logs(ws, queue))
+    receiver = asyncio.create_task(_wait_disconnect(ws))
     try:
-        async for line in proc.stdout:
-            if line:
-                await ws.send_text(line.decode().rstrip())
-    except WebSocketDisconnect:
-        pass
+        await asyncio.wait({sender, receiver}, return_when=asyncio.FIRST_COMPLETED)
     finally:
-        try:
-            if proc.returncode is None:
-                proc.kill()
-        except ProcessLookupError:
-            pass
-        await proc.wait()
+        stream.close()
+        for task in (producer, sender, receiver):
+            task.cancel()
+        await asyncio.gather(producer, sender, receiver, return_exceptions=True)
         try:
             await ws.close()
         except RuntimeError:
             pass
 
+class _StaticUI(StaticFiles):
+    """
+    StaticFiles that only answers GET and HEAD requests.
+    Mounted at the root it would otherwise catch every unmatched path: websockets
+    (which StaticFiles asserts against) and other methods (405 instead of 404).
+    """
+    async def __call__(self, scope, receive, send):
+        if scope["type"] == "websocket":
+            await WebSocketClose()(scope, receive, send)
+        elif scope["type"] == "http" and scope["method"] not in ("GET", "HEAD"):
+            raise HTTPException(status_code=404)
+        else:
+            await super().__call__(scope, receive, send)
+
+# Static web UI at the root, index.html included; mounted last so it does not shadow the routes above
+app.mount("/", _StaticUI(directory=STATIC_PATH, html=True), name="static")
+
 if __name__ == "__main__":
-    uvicorn.run(app, host="0.0.0.0", port=8000)
+    uvicorn.run(
+        "main:app",
+        host="0.0.0.0",
+        port=8000,
+        loop="uvloop",
+        http="httptools",
+        ws="websockets",
+        lifespan="on",
+        workers=min(os.cpu_count() or 1, 4),
+    )
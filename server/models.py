@@ -1,14 +1,38 @@
-from pydantic import BaseModel
+import shlex
+from functools import cached_property
+from typing import List
 
-# TODO: It would be nice to have these fields validated
+from pydantic import BaseModel, ConfigDict, Field
+
+# Experiment names double as directory names, image tags and container names
+NAME_PATTERN = r"^[A-Za-z0-9_\-]+$"
 
 # Models
 class Experiment(BaseModel):
-    name: str
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
+    name: str = Field(..., pattern=NAME_PATTERN)
     ref: str
     code: str
     entrypoint: str = ""
     artifacts_path: str = ""
 
+    @cached_property
+    def tag(self) -> str:
+        """Docker image tag derived from the name."""
+        return self.name.lower().replace("_", "-")
+
+    @cached_property
+    def container_name(self) -> str:
+        """Docker container name derived from the name."""
+        return self.name.replace("_", "-") + "-container"
+
+    @cached_property
+    def entrypoint_argv(self) -> List[str]:
+        """Entrypoint split into container command arguments."""
+        return shlex.split(self.entrypoint)
+
 class NameRequest(BaseModel):
-    experiment_name: str
+    model_config = ConfigDict(frozen=True)
+
+    experiment_name: str = Field(..., pattern=NAME_PATTERN)
@@ -51,6 +51,20 @@ function showConfig(experiments) {
   });
 }
 
+function logBuildMessage(line) {
+  if (!line.trim()) return;
+  let msg;
+  try {
+    msg = JSON.parse(line);
+  } catch {
+    return log(line);
+  }
+  let text = msg.stream ?? msg.status ?? msg.error ?? msg.detail;
+  if (text == null) return;
+  if (typeof text !== "string") text = JSON.stringify(text); // e.g. 422 validation details
+  if (text) log(text.replace(/\n$/, ""));
+}
+
 async function build() {
   clearOutput();
   log(`POST /build`, true); // consistent green log with other actions
@@ -62,12 +76,18 @@ async function build() {
   })).body.getReader();
   const dec = new TextDecoder();
 
+  // Build output is NDJSON straight from the Docker Engine
+  let buf = "";
   let doneReading = false;
   while (!doneReading) {
     const {done, value} = await reader.read();
     doneReading = done;
-    if (value) log(dec.decode(value)); // log streaming output
+    buf += dec.decode(value, {stream: !done});
+    const lines = buf.split("\n");
+    buf = lines.pop();
+    lines.forEach(logBuildMessage);
   }
+  logBuildMessage(buf);
 
   log("[build complete]", true); // green when finished
 }